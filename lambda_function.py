@@ -1,21 +1,36 @@
 import json
+from google.auth.exceptions import RefreshError
 from google.oauth2.service_account import Credentials
 from source.secretsmanager import SecretsManagerClient
 from source.googlecalendar import GoogleCalendarClient
 from source.calendaremitter import CalendarEmitter
 from source.scraper import Scraper
 
-def handler(event, context):
-    secrets_manager_client = SecretsManagerClient('us-east-1')
-    service_account_info = json.loads(secrets_manager_client.get_secret('asphalt-green-google-calendar'))
+SERVICE_ACCOUNT_SECRET_ID = 'asphalt-green-google-calendar'
+CALENDAR_ID_SECRET_ID = 'asphalt-green-google-calendar-id'
+SECRET_IDS = (SERVICE_ACCOUNT_SECRET_ID, CALENDAR_ID_SECRET_ID)
+
+def _sync_calendar(secrets_manager_client: SecretsManagerClient):
+    secrets = secrets_manager_client.get_secrets(SECRET_IDS)
+    service_account_info = json.loads(secrets[SERVICE_ACCOUNT_SECRET_ID])
     credentials = Credentials.from_service_account_info(service_account_info,
                                                         scopes=['https://www.googleapis.com/auth/calendar'])
 
     calendar_emitter = CalendarEmitter(GoogleCalendarClient(credentials))
-    calendar_id = secrets_manager_client.get_secret('asphalt-green-google-calendar-id')
+    calendar_id = secrets[CALENDAR_ID_SECRET_ID]
 
     calendar_emitter.clear_calendar(calendar_id)
-    created_events = calendar_emitter.emit_calendar_tuples(calendar_id, Scraper().get_field_hours())
+    return calendar_emitter.emit_calendar_tuples(calendar_id, Scraper().get_field_hours())
+
+def handler(event, context):
+    secrets_manager_client = SecretsManagerClient('us-east-1')
+    try:
+        created_events = _sync_calendar(secrets_manager_client)
+    except RefreshError:
+        # Google rejected the service account credentials, which may be a cached key that has since been
+        # rotated, so drop the cached secrets and try once more with freshly fetched ones.
+        secrets_manager_client.invalidate(SECRET_IDS)
+        created_events = _sync_calendar(secrets_manager_client)
 
     return {
         'statusCode': 200,
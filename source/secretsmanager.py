@@ -1,20 +1,33 @@
+import time
 import boto3
 from botocore.exceptions import ClientError
 
+DEFAULT_TTL_SECONDS = 300
+# Errors suggesting the cached value may be stale, e.g. revoked access or a rotation in progress.
+INVALIDATING_ERROR_CODES = ('AccessDeniedException', 'DecryptionFailure', 'InvalidRequestException')
+
 class SecretsManagerClient:
-    def __init__(self, region_name:str = None):
+    # Shared across instances so cached secrets survive warm Lambda invocations.
+    # Maps (region, secret ID) to a (secret string, version ID, expiry time) tuple.
+    _cache = {}
+
+    def __init__(self, region_name:str = None, ttl_seconds:float = DEFAULT_TTL_SECONDS):
         """Initialize the Secrets Manager client.
 
         Args:
             region_name: AWS region name as a string. If None, it will use the default region set in the environment.
+            ttl_seconds: Number of seconds a secret fetched by this client is cached before being fetched again.
         """
         self.client = boto3.client('secretsmanager', region_name=region_name)
+        self.region_name = self.client.meta.region_name
+        self.ttl_seconds = ttl_seconds
 
-    def get_secret(self, secret_id: str):
-        """Retrieve a secret from AWS Secrets Manager.
+    def get_secret(self, secret_id: str, version_id: str = None):
+        """Retrieve a secret from AWS Secrets Manager, using the cache when possible.
 
         Args:
             secret_id (str): The ID or name of the secret to retrieve.
+            version_id (str): Optional version ID of the secret. A cached value of a different version is refetched.
 
         Returns:
             str: Secret value as a string.
@@ -23,11 +36,136 @@ class SecretsManagerClient:
             ValueError: If the secret cannot be found.
             ClientError: If an AWS error is encountered.
         """
+        cached = self._get_cached(secret_id, version_id)
+        if cached is not None:
+            return cached
+
+        kwargs = {'SecretId': secret_id}
+        if version_id is not None:
+            kwargs['VersionId'] = version_id
+
         try:
-            response = self.client.get_secret_value(SecretId=secret_id)
-            return response['SecretString']
+            response = self.client.get_secret_value(**kwargs)
         except ClientError as e:
+            if e.response['Error']['Code'] in INVALIDATING_ERROR_CODES:
+                self.invalidate([secret_id])
             if e.response['Error']['Code'] == 'ResourceNotFoundException':
                 raise ValueError("Secret not found: {}".format(secret_id))
+            raise
+
+        self._set_cached(secret_id, response['SecretString'], response.get('VersionId'))
+        return response['SecretString']
+
+    def get_secrets(self, secret_ids: list, version_ids: dict = None):
+        """Retrieve several secrets from AWS Secrets Manager in a single batch call, using the cache when possible.
+
+        BatchGetSecretValue cannot request specific versions, so secrets with an entry in version_ids that
+        are not cached at that version are fetched individually. If the batch call is denied, e.g. because
+        the role lacks the secretsmanager:BatchGetSecretValue permission, each secret is fetched individually.
+
+        Args:
+            secret_ids (list): The IDs or names of the secrets to retrieve.
+            version_ids (dict): Optional version IDs keyed by secret ID. Cached values of a different version are refetched.
+
+        Returns:
+            dict: Secret values as strings, keyed by the requested secret ID.
+
+        Raises:
+            ValueError: If a secret cannot be found.
+            ClientError: If an AWS error is encountered.
+        """
+        version_ids = version_ids or {}
+        secrets = {}
+        missing_ids = []
+        for secret_id in secret_ids:
+            cached = self._get_cached(secret_id, version_ids.get(secret_id))
+            if cached is not None:
+                secrets[secret_id] = cached
+            elif secret_id in version_ids:
+                secrets[secret_id] = self.get_secret(secret_id, version_ids[secret_id])
             else:
+                missing_ids.append(secret_id)
+
+        if not missing_ids:
+            return secrets
+
+        try:
+            secrets.update(self._batch_get_secrets(missing_ids))
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'AccessDeniedException':
                 raise
+            for secret_id in missing_ids:
+                secrets[secret_id] = self.get_secret(secret_id)
+
+        return secrets
+
+    def invalidate(self, secret_ids: list = None):
+        """Remove secrets from this client's region of the cache, or every secret in the region if no IDs are given.
+
+        Args:
+            secret_ids (list): The IDs or names of the secrets to remove.
+        """
+        if secret_ids is None:
+            secret_ids = [key[1] for key in self._cache if key[0] == self.region_name]
+        for secret_id in secret_ids:
+            self._cache.pop((self.region_name, secret_id), None)
+
+    def _batch_get_secrets(self, secret_ids: list):
+        secrets = {}
+        secret_values = []
+        kwargs = {'SecretIdList': secret_ids}
+        while True:
+            try:
+                response = self.client.batch_get_secret_value(**kwargs)
+            except ClientError as e:
+                if e.response['Error']['Code'] in INVALIDATING_ERROR_CODES:
+                    self.invalidate(secret_ids)
+                if e.response['Error']['Code'] == 'ResourceNotFoundException':
+                    raise ValueError("Secret not found: {}".format(', '.join(secret_ids)))
+                raise
+
+            errors = response.get('Errors', [])
+            if errors:
+                self.invalidate([error['SecretId'] for error in errors
+                                 if error['ErrorCode'] in INVALIDATING_ERROR_CODES])
+                failed_ids = ', '.join(error['SecretId'] for error in errors)
+                if any(error['ErrorCode'] == 'ResourceNotFoundException' for error in errors):
+                    raise ValueError("Secret not found: {}".format(failed_ids))
+                raise ClientError({
+                    'Error': {'Code': errors[0]['ErrorCode'],
+                              'Message': "Failed to retrieve secrets: {}".format(failed_ids)}
+                }, 'BatchGetSecretValue')
+
+            secret_values.extend(response['SecretValues'])
+            if not response.get('NextToken'):
+                break
+            kwargs['NextToken'] = response['NextToken']
+
+        # Values are returned with their full name and ARN, so map each back to the ID the caller passed,
+        # which may be a name, a full ARN, or a partial ARN missing the "-" and six character random suffix.
+        # Exact matches win, and the suffix length check keeps a name that prefixes another from matching it.
+        for secret_id in secret_ids:
+            secret = next((s for s in secret_values if secret_id in (s['Name'], s['ARN'])), None)
+            if secret is None:
+                secret = next((s for s in secret_values
+                               if s['ARN'].startswith(secret_id + '-') and len(s['ARN']) == len(secret_id) + 7), None)
+            if secret is None:
+                raise ValueError("Secret missing from batch response: {}".format(secret_id))
+            self._set_cached(secret_id, secret['SecretString'], secret.get('VersionId'))
+            secrets[secret_id] = secret['SecretString']
+        return secrets
+
+    def _get_cached(self, secret_id: str, version_id: str = None):
+        cached = self._cache.get((self.region_name, secret_id))
+        if cached is None:
+            return None
+        value, cached_version_id, expires_at = cached
+        if time.monotonic() >= expires_at:
+            self.invalidate([secret_id])
+            return None
+        if version_id is not None and cached_version_id != version_id:
+            return None
+        return value
+
+    def _set_cached(self, secret_id: str, value: str, version_id: str):
+        self._cache[(self.region_name, secret_id)] = (value, version_id, time.monotonic() + self.ttl_seconds)
@@ -0,0 +1,51 @@
+import unittest
+from unittest.mock import patch
+from google.auth.exceptions import RefreshError
+import lambda_function
+
+class TestLambdaFunction(unittest.TestCase):
+    """Tests for the Lambda handler"""
+
+    def setUp(self):
+        patchers = {
+            'secrets_manager_client': patch('lambda_function.SecretsManagerClient'),
+            'credentials': patch('lambda_function.Credentials'),
+            'google_calendar_client': patch('lambda_function.GoogleCalendarClient'),
+            'calendar_emitter': patch('lambda_function.CalendarEmitter'),
+            'scraper': patch('lambda_function.Scraper'),
+        }
+        self.mocks = {name: patcher.start() for name, patcher in patchers.items()}
+        for patcher in patchers.values():
+            self.addCleanup(patcher.stop)
+
+        self.secrets_manager_client = self.mocks['secrets_manager_client'].return_value
+        self.secrets_manager_client.get_secrets.return_value = {
+            lambda_function.SERVICE_ACCOUNT_SECRET_ID: '{}',
+            lambda_function.CALENDAR_ID_SECRET_ID: 'test-calendar-id',
+        }
+        self.calendar_emitter = self.mocks['calendar_emitter'].return_value
+
+    def test_handler_retries_on_refresh_error(self):
+        """Test method for the handler function assuming Google rejects the cached credentials once"""
+        self.calendar_emitter.clear_calendar.side_effect = [RefreshError('invalid_grant'), None]
+        self.calendar_emitter.emit_calendar_tuples.return_value = ['test-event']
+
+        result = lambda_function.handler(None, None)
+
+        self.assertEqual(result, {'statusCode': 200, 'body': ['test-event']})
+        self.secrets_manager_client.invalidate.assert_called_once_with(lambda_function.SECRET_IDS)
+        self.assertEqual(self.secrets_manager_client.get_secrets.call_count, 2)
+
+    def test_handler_raises_repeated_refresh_error(self):
+        """Test method for the handler function assuming Google rejects freshly fetched credentials too"""
+        self.calendar_emitter.clear_calendar.side_effect = RefreshError('invalid_grant')
+
+        with self.assertRaises(RefreshError):
+            lambda_function.handler(None, None)
+
+        self.secrets_manager_client.invalidate.assert_called_once_with(lambda_function.SECRET_IDS)
+        self.assertEqual(self.secrets_manager_client.get_secrets.call_count, 2)
+        self.assertEqual(self.calendar_emitter.clear_calendar.call_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
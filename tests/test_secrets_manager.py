@@ -1,11 +1,14 @@
 import unittest
-from unittest.mock import patch
+from unittest.mock import patch, Mock
 from botocore.exceptions import ClientError
 from source.secretsmanager import SecretsManagerClient
 
 class TestSecretsManagerClient(unittest.TestCase):
     """Tests for the SecretsManagerClient class"""
 
+    def setUp(self):
+        SecretsManagerClient._cache.clear()
+
     @patch('boto3.client')
     def test_get_secret_successful_retrieval(self, mock_client):
         """Test method for the get_secret function assuming successful SM call and retrieval"""
@@ -41,5 +44,290 @@ class TestSecretsManagerClient(unittest.TestCase):
 
         self.assertTrue('An internal error occurred' in str(context.exception))
 
+    @patch('boto3.client')
+    def test_get_secret_uses_cache(self, mock_client):
+        """Test method for the get_secret function assuming the secret is already cached"""
+        mock_client.return_value.get_secret_value.return_value = {
+            'SecretString': 'test-value', 'VersionId': 'v1'
+        }
+
+        SecretsManagerClient().get_secret('test-id')
+        result = SecretsManagerClient().get_secret('test-id')
+
+        self.assertEqual(result, 'test-value')
+        mock_client.return_value.get_secret_value.assert_called_once_with(SecretId='test-id')
+
+    @patch('source.secretsmanager.time.monotonic')
+    @patch('boto3.client')
+    def test_get_secret_cache_expired(self, mock_client, mock_monotonic):
+        """Test method for the get_secret function assuming the cached secret is past its TTL"""
+        mock_client.return_value.get_secret_value.side_effect = [
+            {'SecretString': 'old-value', 'VersionId': 'v1'},
+            {'SecretString': 'new-value', 'VersionId': 'v2'},
+        ]
+        mock_monotonic.return_value = 0
+
+        client = SecretsManagerClient(ttl_seconds=5)
+        client.get_secret('test-id')
+        mock_monotonic.return_value = 10
+        result = client.get_secret('test-id')
+
+        self.assertEqual(result, 'new-value')
+        self.assertEqual(mock_client.return_value.get_secret_value.call_count, 2)
+
+    @patch('boto3.client')
+    def test_get_secret_different_version(self, mock_client):
+        """Test method for the get_secret function assuming a version other than the cached one is requested"""
+        mock_client.return_value.get_secret_value.side_effect = [
+            {'SecretString': 'old-value', 'VersionId': 'v1'},
+            {'SecretString': 'new-value', 'VersionId': 'v2'},
+        ]
+
+        client = SecretsManagerClient()
+        client.get_secret('test-id')
+        self.assertEqual(client.get_secret('test-id', version_id='v1'), 'old-value')
+        result = client.get_secret('test-id', version_id='v2')
+
+        self.assertEqual(result, 'new-value')
+        mock_client.return_value.get_secret_value.assert_called_with(SecretId='test-id', VersionId='v2')
+
+    @patch('boto3.client')
+    def test_get_secret_access_denied_invalidates_cache(self, mock_client):
+        """Test method for the get_secret function assuming SM denies access to a cached secret"""
+        mock_client.return_value.get_secret_value.side_effect = [
+            {'SecretString': 'test-value', 'VersionId': 'v1'},
+            ClientError({
+                'Error': {'Code': 'AccessDeniedException', 'Message': 'Access denied'}
+            }, 'GetSecretValue'),
+        ]
+
+        client = SecretsManagerClient()
+        client.get_secret('test-id')
+        with self.assertRaises(ClientError):
+            client.get_secret('test-id', version_id='v2')
+
+        mock_client.return_value.get_secret_value.side_effect = None
+        mock_client.return_value.get_secret_value.return_value = {'SecretString': 'new-value', 'VersionId': 'v2'}
+
+        self.assertEqual(client.get_secret('test-id'), 'new-value')
+        self.assertEqual(mock_client.return_value.get_secret_value.call_count, 3)
+
+    @patch('boto3.client')
+    def test_get_secret_throttling_keeps_cache(self, mock_client):
+        """Test method for the get_secret function assuming SM throttles a request for another version"""
+        mock_client.return_value.get_secret_value.side_effect = [
+            {'SecretString': 'test-value', 'VersionId': 'v1'},
+            ClientError({
+                'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}
+            }, 'GetSecretValue'),
+        ]
+
+        client = SecretsManagerClient()
+        client.get_secret('test-id')
+        with self.assertRaises(ClientError):
+            client.get_secret('test-id', version_id='v2')
+
+        self.assertEqual(client.get_secret('test-id'), 'test-value')
+        self.assertEqual(mock_client.return_value.get_secret_value.call_count, 2)
+
+    @patch('boto3.client')
+    def test_get_secrets_successful_retrieval(self, mock_client):
+        """Test method for the get_secrets function assuming a successful batch SM call"""
+        mock_client.return_value.batch_get_secret_value.return_value = {
+            'SecretValues': [
+                {'Name': 'first-id', 'ARN': 'arn:first', 'SecretString': 'first-value', 'VersionId': 'v1'},
+                {'Name': 'second-id', 'ARN': 'arn:second', 'SecretString': 'second-value', 'VersionId': 'v1'},
+            ],
+            'Errors': [],
+        }
+
+        client = SecretsManagerClient()
+        result = client.get_secrets(['first-id', 'second-id'])
+        client.get_secrets(['first-id', 'second-id'])
+
+        self.assertEqual(result, {'first-id': 'first-value', 'second-id': 'second-value'})
+        mock_client.return_value.batch_get_secret_value.assert_called_once_with(SecretIdList=['first-id', 'second-id'])
+
+    @patch('boto3.client')
+    def test_get_secrets_only_fetches_uncached(self, mock_client):
+        """Test method for the get_secrets function assuming some secrets are already cached"""
+        mock_client.return_value.get_secret_value.return_value = {
+            'SecretString': 'first-value', 'VersionId': 'v1'
+        }
+        mock_client.return_value.batch_get_secret_value.return_value = {
+            'SecretValues': [
+                {'Name': 'second-id', 'ARN': 'arn:second', 'SecretString': 'second-value', 'VersionId': 'v1'},
+            ],
+            'Errors': [],
+        }
+
+        client = SecretsManagerClient()
+        client.get_secret('first-id')
+        result = client.get_secrets(['first-id', 'second-id'])
+
+        self.assertEqual(result, {'first-id': 'first-value', 'second-id': 'second-value'})
+        mock_client.return_value.batch_get_secret_value.assert_called_once_with(SecretIdList=['second-id'])
+
+    @patch('boto3.client')
+    def test_get_secrets_cannot_find_secret(self, mock_client):
+        """Test method for the get_secrets function assuming one of the secrets does not exist"""
+        mock_client.return_value.batch_get_secret_value.return_value = {
+            'SecretValues': [],
+            'Errors': [
+                {'SecretId': 'nonexistentid', 'ErrorCode': 'ResourceNotFoundException', 'Message': 'Secret not found'},
+            ],
+        }
+
+        with self.assertRaises(ValueError) as context:
+            SecretsManagerClient().get_secrets(['nonexistentid'])
+
+        self.assertTrue('Secret not found' in str(context.exception))
+
+    @patch('source.secretsmanager.time.monotonic')
+    @patch('boto3.client')
+    def test_get_secret_ttl_is_per_entry(self, mock_client, mock_monotonic):
+        """Test method for the get_secret function assuming clients with different TTLs share the cache"""
+        mock_client.return_value.get_secret_value.return_value = {
+            'SecretString': 'test-value', 'VersionId': 'v1'
+        }
+        mock_monotonic.return_value = 0
+
+        SecretsManagerClient(ttl_seconds=60).get_secret('test-id')
+        mock_monotonic.return_value = 10
+        SecretsManagerClient(ttl_seconds=5).get_secret('test-id')
+
+        mock_client.return_value.get_secret_value.assert_called_once_with(SecretId='test-id')
+
+    @patch('boto3.client')
+    def test_get_secret_cache_is_per_region(self, mock_client):
+        """Test method for the get_secret function assuming the same secret is requested in two regions"""
+        east_client, west_client = Mock(), Mock()
+        east_client.meta.region_name = 'us-east-1'
+        east_client.get_secret_value.return_value = {'SecretString': 'east-value', 'VersionId': 'v1'}
+        west_client.meta.region_name = 'us-west-2'
+        west_client.get_secret_value.return_value = {'SecretString': 'west-value', 'VersionId': 'v1'}
+        mock_client.side_effect = [east_client, west_client]
+
+        SecretsManagerClient('us-east-1').get_secret('test-id')
+        result = SecretsManagerClient('us-west-2').get_secret('test-id')
+
+        self.assertEqual(result, 'west-value')
+
+    @patch('boto3.client')
+    def test_get_secrets_partial_arn(self, mock_client):
+        """Test method for the get_secrets function assuming the secret is requested by a partial ARN"""
+        partial_arn = 'arn:aws:secretsmanager:us-east-1:123456789012:secret:test-id'
+        mock_client.return_value.batch_get_secret_value.return_value = {
+            'SecretValues': [
+                {'Name': 'test-id', 'ARN': partial_arn + '-AbCdEf', 'SecretString': 'test-value', 'VersionId': 'v1'},
+            ],
+            'Errors': [],
+        }
+
+        client = SecretsManagerClient()
+        result = client.get_secrets([partial_arn])
+        client.get_secrets([partial_arn])
+
+        self.assertEqual(result, {partial_arn: 'test-value'})
+        mock_client.return_value.batch_get_secret_value.assert_called_once()
+
+    @patch('boto3.client')
+    def test_get_secrets_partial_arns_sharing_prefix(self, mock_client):
+        """Test method for the get_secrets function assuming partial ARNs where one secret name prefixes another"""
+        prefix = 'arn:aws:secretsmanager:us-east-1:123456789012:secret:'
+        mock_client.return_value.batch_get_secret_value.return_value = {
+            'SecretValues': [
+                {'Name': 'test-id-suffix', 'ARN': prefix + 'test-id-suffix-GhIjKl',
+                 'SecretString': 'suffix-value', 'VersionId': 'v1'},
+                {'Name': 'test-id', 'ARN': prefix + 'test-id-AbCdEf',
+                 'SecretString': 'test-value', 'VersionId': 'v1'},
+            ],
+            'Errors': [],
+        }
+
+        result = SecretsManagerClient().get_secrets([prefix + 'test-id', prefix + 'test-id-suffix'])
+
+        self.assertEqual(result, {prefix + 'test-id': 'test-value', prefix + 'test-id-suffix': 'suffix-value'})
+
+    @patch('boto3.client')
+    def test_get_secrets_missing_from_response(self, mock_client):
+        """Test method for the get_secrets function assuming a requested secret is absent from the batch response"""
+        mock_client.return_value.batch_get_secret_value.return_value = {
+            'SecretValues': [
+                {'Name': 'other-id', 'ARN': 'arn:other', 'SecretString': 'other-value', 'VersionId': 'v1'},
+            ],
+            'Errors': [],
+        }
+
+        with self.assertRaises(ValueError) as context:
+            SecretsManagerClient().get_secrets(['test-id'])
+
+        self.assertTrue('test-id' in str(context.exception))
+
+    @patch('boto3.client')
+    def test_get_secrets_reports_every_error(self, mock_client):
+        """Test method for the get_secrets function assuming several secrets fail in the batch"""
+        mock_client.return_value.batch_get_secret_value.return_value = {
+            'SecretValues': [],
+            'Errors': [
+                {'SecretId': 'first-id', 'ErrorCode': 'DecryptionFailure', 'Message': 'Cannot decrypt'},
+                {'SecretId': 'second-id', 'ErrorCode': 'DecryptionFailure', 'Message': 'Cannot decrypt'},
+            ],
+        }
+
+        with self.assertRaises(ClientError) as context:
+            SecretsManagerClient().get_secrets(['first-id', 'second-id'])
+
+        self.assertTrue('first-id, second-id' in str(context.exception))
+
+    @patch('boto3.client')
+    def test_get_secrets_different_version(self, mock_client):
+        """Test method for the get_secrets function assuming a version other than the cached one is requested"""
+        mock_client.return_value.get_secret_value.side_effect = [
+            {'SecretString': 'old-value', 'VersionId': 'v1'},
+            {'SecretString': 'new-value', 'VersionId': 'v2'},
+        ]
+
+        client = SecretsManagerClient()
+        client.get_secret('test-id')
+        result = client.get_secrets(['test-id'], version_ids={'test-id': 'v2'})
+
+        self.assertEqual(result, {'test-id': 'new-value'})
+        mock_client.return_value.get_secret_value.assert_called_with(SecretId='test-id', VersionId='v2')
+        mock_client.return_value.batch_get_secret_value.assert_not_called()
+
+    @patch('boto3.client')
+    def test_get_secrets_batch_access_denied_falls_back(self, mock_client):
+        """Test method for the get_secrets function assuming the role lacks the BatchGetSecretValue permission"""
+        mock_client.return_value.get_secret_value.return_value = {
+            'SecretString': 'test-value', 'VersionId': 'v1'
+        }
+        mock_client.return_value.batch_get_secret_value.side_effect = ClientError({
+            'Error': {'Code': 'AccessDeniedException', 'Message': 'Access denied'}
+        }, 'BatchGetSecretValue')
+
+        result = SecretsManagerClient().get_secrets(['first-id', 'second-id'])
+
+        self.assertEqual(result, {'first-id': 'test-value', 'second-id': 'test-value'})
+        self.assertEqual(mock_client.return_value.get_secret_value.call_count, 2)
+
+    @patch('boto3.client')
+    def test_get_secrets_failed_aws_call_keeps_other_entries(self, mock_client):
+        """Test method for the get_secrets function assuming a failed batch call alongside a cached secret"""
+        mock_client.return_value.get_secret_value.return_value = {
+            'SecretString': 'first-value', 'VersionId': 'v1'
+        }
+        mock_client.return_value.batch_get_secret_value.side_effect = ClientError({
+            'Error': {'Code': 'InternalServiceError', 'Message': 'An internal error occurred'}
+        }, 'BatchGetSecretValue')
+
+        client = SecretsManagerClient()
+        client.get_secret('first-id')
+        with self.assertRaises(ClientError):
+            client.get_secrets(['first-id', 'second-id'])
+
+        self.assertEqual(client.get_secret('first-id'), 'first-value')
+        mock_client.return_value.get_secret_value.assert_called_once()
+
 if __name__ == '__main__':
     unittest.main()